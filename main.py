@@ -1,9 +1,22 @@
 import flet as ft
+import base64
+import bisect
+import hashlib
 import json
+import pickle
 import random
 import os
+import shutil
+import tempfile
 import traceback
 
+try:
+    # Faster decoder where a wheel exists; the stdlib parser is the fallback
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # -------------------------------------------------------------------------
 # CONFIG
 # -------------------------------------------------------------------------
@@ -17,49 +30,204 @@ COLORS = {
     'text': "blueGrey900"
 }
 
+# Option rows pre-built for the question screen; grown on demand for larger questions
+MAX_OPTIONS = 6
+
+# Images whose base64 payload exceeds this are written to a temp file at load time
+# and served to Flet from disk instead of staying resident as strings
+LARGE_IMAGE_B64 = 4 * 1024
+
 # -------------------------------------------------------------------------
 # DATA MODELS
 # -------------------------------------------------------------------------
+class Option:
+    __slots__ = ('text', 'is_correct')
+
+    def __init__(self, data):
+        self.text = data.get("text", "")
+        self.is_correct = data.get("is_correct", False)
+
 class Question:
+    # Fixed attribute set: no per-instance __dict__
+    __slots__ = ('id', 'text', 'options', 'is_multichoice', 'image_base64', 'image_path',
+                 'display_order', 'user_answers', 'is_locked', '_correct_set', '_correct_mask', '_user_mask')
+
     def __init__(self, data):
         self.id = data.get("id")
         self.text = data.get("text", "")
-        self.options = data.get("options", [])
+        self.options = [Option(opt) for opt in data.get("options", [])]
         self.is_multichoice = data.get("is_multichoice", False)
         self.image_base64 = data.get("image_base64", None)
+        self.image_path = None # Set by ExamEngine for images spilled to disk; never read from the file
         
-        self.user_answers = [] 
+        # Options never move; shuffling permutes display_order and answers use option indices
+        self.display_order = list(range(len(self.options)))
+        self.user_answers = set() # Option indices, updated incrementally on toggle
         self.is_locked = False 
+        self._correct_set = frozenset(i for i, opt in enumerate(self.options) if opt.is_correct)
+        # Bit i set = option i; toggle()/select_only() keep _user_mask in step with user_answers
+        self._correct_mask = 0
+        for i in self._correct_set:
+            self._correct_mask |= 1 << i
+        self._user_mask = 0
+
+    def toggle(self, idx, selected):
+        if selected:
+            self.user_answers.add(idx)
+            self._user_mask |= 1 << idx
+        else:
+            self.user_answers.discard(idx)
+            self._user_mask &= ~(1 << idx)
+
+    def select_only(self, idx):
+        self.user_answers = {idx}
+        self._user_mask = 1 << idx
 
     def check_answer(self):
-        selected_indices = set(self.user_answers)
-        correct_indices = {i for i, opt in enumerate(self.options) if opt['is_correct']}
-        return selected_indices == correct_indices
+        return self._user_mask == self._correct_mask
 
     def get_correct_indices(self):
-        return [i for i, opt in enumerate(self.options) if opt['is_correct']]
+        return self._correct_set
 
 # -------------------------------------------------------------------------
 # LOGIC ENGINE
 # -------------------------------------------------------------------------
 class ExamEngine:
     def __init__(self):
-        self.all_questions = []
+        self._raw = [] # Question dicts sorted by id; Question objects are only built in start_exam
+        self._ids = [] # Sorted ids parallel to _raw, for bisecting ID ranges
         self.active_questions = []
+        self.total = 0 # len(active_questions), fixed for the duration of an exam
         self.current_idx = 0
         self.correct_count = 0
         self.answered_count = 0
         self.file_loaded = False
+        self.image_dir = None
+        self._image_paths = {} # Index into _raw -> spilled image file, kept off the question dicts
+        self._rng = random.Random() # Engine-local generator for both shuffles
+
+    def get_storage_dir(self):
+        """Private app directory (mode 0700) for the parse cache; never a shared temp dir."""
+        base = os.environ.get("FLET_APP_STORAGE_DATA") or os.path.join(os.path.expanduser("~"), ".exam_engine")
+        path = os.path.join(base, "cache")
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        return path
+
+    def get_cache_key(self, filepath):
+        return hashlib.sha1(os.path.abspath(filepath).encode('utf-8')).hexdigest()
+
+    def get_cache_path(self, filepath):
+        """Cache is keyed by source path and lives in the private storage dir."""
+        return os.path.join(self.get_storage_dir(), f"exam_cache_{self.get_cache_key(filepath)}.pkl")
+
+    def get_image_dir(self, filepath):
+        """One image dir per source file, next to its cache in the private storage dir."""
+        path = os.path.join(self.get_storage_dir(), f"exam_img_{self.get_cache_key(filepath)}")
+        os.makedirs(path, mode=0o700, exist_ok=True)
+        return path
+
+    def prune_storage(self, filepath, used_images):
+        """Removes caches and image dirs left by other files, and images this file no longer uses."""
+        try:
+            storage = self.get_storage_dir()
+            cache_path = self.get_cache_path(filepath)
+            for entry in os.listdir(storage):
+                path = os.path.join(storage, entry)
+                if entry.startswith("exam_img_") and path != self.image_dir:
+                    shutil.rmtree(path, ignore_errors=True)
+                elif entry.startswith("exam_cache_") and path != cache_path:
+                    os.remove(path)
+            if self.image_dir:
+                for entry in os.listdir(self.image_dir):
+                    if entry not in used_images:
+                        os.remove(os.path.join(self.image_dir, entry))
+        except OSError:
+            pass # Cleanup is best effort
+
+    def write_atomic(self, path, write):
+        """Runs write(f) on a temp file next to path, then swaps it in with os.replace."""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def read_exam_file(self, filepath):
+        """Returns (decoded JSON list, source signature); the signature is None on a cache hit."""
+        with open(filepath, 'rb') as f:
+            st = os.fstat(f.fileno())
+            # The cache starts with the source's size and mtime; both must match exactly
+            source_sig = (st.st_size, st.st_mtime_ns)
+            try:
+                cache_path = self.get_cache_path(filepath)
+                with open(cache_path, 'rb') as cf:
+                    if pickle.load(cf) == source_sig:
+                        return pickle.load(cf), None
+            except Exception:
+                pass # Missing, stale or corrupt cache is just a miss
+
+            # Both decoders take the raw utf-8 bytes directly
+            return json_loads(f.read()), source_sig
+
+    def write_exam_cache(self, filepath, source_sig, raw_data):
+        def write_cache(cf):
+            pickle.dump(source_sig, cf, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(raw_data, cf, protocol=pickle.HIGHEST_PROTOCOL)
+
+        try:
+            self.write_atomic(self.get_cache_path(filepath), write_cache)
+        except Exception:
+            pass # Caching is best effort
 
     def load_data_from_path(self, filepath):
         """Loads JSON data from a specific file path selected by user."""
         try:
-            # Try reading strictly as utf-8 first
-            with open(filepath, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
+            raw_data, source_sig = self.read_exam_file(filepath)
             
-            self.all_questions = sorted([Question(item) for item in raw_data], key=lambda x: x.id)
+            ids = [item.get("id") for item in raw_data]
+            # Exam files are normally written in id order; only sort when they are not
+            if any(a > b for a, b in zip(ids, ids[1:])):
+                raw_data.sort(key=lambda d: d.get("id"))
+                ids = [item.get("id") for item in raw_data]
+            # Check every entry before touching anything on disk
+            for item in raw_data:
+                image_base64 = item.get("image_base64")
+                if image_base64 is not None and not isinstance(image_base64, str):
+                    raise TypeError(f"Question {item.get('id')}: image_base64 must be a string")
+
+            # Spill large images to disk so only small ones stay in memory
+            try:
+                image_dir = self.get_image_dir(filepath)
+            except OSError:
+                image_dir = None # Keep every image as base64
+            image_paths = {}
+            if image_dir:
+                for i, item in enumerate(raw_data):
+                    image_base64 = item.get("image_base64")
+                    if image_base64 and len(image_base64) > LARGE_IMAGE_B64:
+                        path = self.write_image_file(image_dir, image_base64)
+                        if path:
+                            image_paths[i] = path
+            self._raw = raw_data
+            self._ids = ids
+            self._image_paths = image_paths
+            self.image_dir = image_dir
             self.file_loaded = True
+
+            # Only a successful load is cached, before its spilled images are dropped from memory
+            if source_sig is not None:
+                self.write_exam_cache(filepath, source_sig, raw_data)
+            for i in image_paths:
+                raw_data[i]["image_base64"] = None
+
+            # Only now is the previous exam's data safe to delete
+            self.prune_storage(filepath, {os.path.basename(path) for path in image_paths.values()})
             return None
         except Exception as e:
             # Return full error trace to help debug on mobile
@@ -72,28 +240,59 @@ class ExamEngine:
         self.correct_count = 0
         self.answered_count = 0
         
-        filtered = [q for q in self.all_questions if start_id <= q.id <= end_id]
+        lo = bisect.bisect_left(self._ids, start_id)
+        hi = bisect.bisect_right(self._ids, end_id)
+        # Fresh Question objects per exam, so answer state starts clean
+        try:
+            filtered = [Question(item) for item in self._raw[lo:hi]]
+            for i, q in enumerate(filtered, lo):
+                q.image_path = self._image_paths.get(i)
+        except Exception as e:
+            # Entries are only validated once built, so report bad ones like a load error
+            return f"{type(e).__name__}: {str(e)}"
         if not filtered:
             return "No questions found in that ID range."
 
-        for q in filtered:
-            q.user_answers = []
-            q.is_locked = False
-            if shuffle_ans:
-                random.shuffle(q.options)
+        rng = self._rng
+        if shuffle_ans:
+            for q in filtered:
+                rng.shuffle(q.display_order)
         
         if shuffle_q:
-            random.shuffle(filtered)
+            rng.shuffle(filtered)
             
         self.active_questions = filtered
+        self.total = len(filtered)
         self.current_idx = 0
         return None
 
+    @property
+    def question_count(self):
+        return len(self._ids)
+
+    @property
+    def last_id(self):
+        return self._ids[-1] if self._ids else None
+
     def get_current(self):
         if 0 <= self.current_idx < len(self.active_questions):
             return self.active_questions[self.current_idx]
         return None
     
+    def write_image_file(self, image_dir, image_base64):
+        """Decodes an image into image_dir so Flet can stream it from disk."""
+        try:
+            # Named by content: repeated ids can't collide, and files from a previous launch are reused
+            key = hashlib.sha1(image_base64.encode('ascii')).hexdigest()
+            path = os.path.join(image_dir, f"img_{key}.bin")
+            if not os.path.exists(path):
+                data = base64.b64decode(image_base64)
+                self.write_atomic(path, lambda f: f.write(data))
+            return path
+        except (OSError, ValueError):
+            # Fall back to sending the base64 string
+            return None
+
     def update_stats(self, is_correct):
         self.answered_count += 1
         if is_correct:
@@ -115,17 +314,17 @@ def main(page: ft.Page):
 
         # --- HELPERS ---
         def get_stats_text():
-            total = len(engine.active_questions)
+            total = engine.total
             pct = (engine.correct_count / engine.answered_count * 100) if engine.answered_count > 0 else 0
             return f"Progress: {engine.answered_count}/{total} | Score: {pct:.0f}%"
 
+        # Single dialog reused across opens; only its text changes
+        stats_dialog = ft.AlertDialog(title=ft.Text("Live Statistics"), content=ft.Text(""))
+
         def show_stats_dialog(e):
-            dlg = ft.AlertDialog(
-                title=ft.Text("Live Statistics"),
-                content=ft.Text(f"Answered: {engine.answered_count}\nCorrect: {engine.correct_count}\nWrong: {engine.answered_count - engine.correct_count}"),
-            )
-            page.dialog = dlg
-            dlg.open = True
+            stats_dialog.content.value = f"Answered: {engine.answered_count}\nCorrect: {engine.correct_count}\nWrong: {engine.answered_count - engine.correct_count}"
+            page.dialog = stats_dialog
+            stats_dialog.open = True
             page.update()
 
         def go_home(e=None):
@@ -159,11 +358,11 @@ def main(page: ft.Page):
                         file_status_text.value = f"FAILED: {err}"
                         file_status_text.color = COLORS['error']
                     else:
-                        file_status_text.value = f"Loaded: {e.files[0].name} ({len(engine.all_questions)} Qs)"
+                        file_status_text.value = f"Loaded: {e.files[0].name} ({engine.question_count} Qs)"
                         file_status_text.color = COLORS['success']
                         # Auto set end ID
-                        if engine.all_questions:
-                            end_id_field.value = str(engine.all_questions[-1].id)
+                        if engine.question_count:
+                            end_id_field.value = str(engine.last_id)
                     page.update()
             else:
                 pass
@@ -182,14 +381,16 @@ def main(page: ft.Page):
                 page.update()
                 return
 
-            try:
-                s_id = int(start_id_field.value)
-                e_id = int(end_id_field.value)
-            except:
+            start_raw = (start_id_field.value or "").strip()
+            end_raw = (end_id_field.value or "").strip()
+            # isdecimal matches exactly the digits int() accepts, unlike isdigit ('²')
+            if not (start_raw.isdecimal() and end_raw.isdecimal()):
                 page.snack_bar = ft.SnackBar(ft.Text("IDs must be numbers"), bgcolor="red")
                 page.snack_bar.open = True
                 page.update()
                 return
+            s_id = int(start_raw)
+            e_id = int(end_raw)
 
             err = engine.start_exam(s_id, e_id, chk_shuffle_q.value, chk_shuffle_a.value)
             if err:
@@ -198,7 +399,7 @@ def main(page: ft.Page):
                 page.update()
                 return
                 
-            load_question_ui()
+            show_question_view()
 
         startup_view = ft.Column([
             ft.Container(height=50),
@@ -241,150 +442,189 @@ def main(page: ft.Page):
 
 
         # --- QUESTION SCREEN ---
-        
-        def load_question_ui():
-            page.clean()
+        # Controls are built once; refresh_question() mutates them in place on navigation
+
+        option_controls = [] # Pool of (row, checkbox, text); the first len(display_order) show the current question
+        rows_by_option = {} # Option index -> its pooled (row, checkbox, text) for the question on screen
+        round_shape = ft.OutlinedBorder(corner_radius=100)
+
+        def on_option_click(e):
+            # One handler for every option row; the row's display position rides on control.data
+            pos = e.control.data
             q = engine.get_current()
+            if q.is_locked: return
+            idx = q.display_order[pos]
             
-            if not q:
-                # Show summary
-                page.add(ft.Text("Exam Finished!", size=30), 
-                         ft.Text(get_stats_text(), size=20),
-                         ft.ElevatedButton("Restart", on_click=go_home))
-                page.update()
-                return
+            if q.is_multichoice:
+                # Immediate coloring for CLICKED item
+                is_correct = q.options[idx].is_correct
+                is_selected = option_controls[pos][1].value 
+                
+                # Sync logic
+                q.toggle(idx, is_selected)
 
-            # 1. Header
-            header = ft.Row([
-                ft.Text(f"Q {engine.current_idx + 1} / {len(engine.active_questions)}", weight=ft.FontWeight.BOLD),
-                ft.IconButton(ft.icons.ANALYTICS, on_click=show_stats_dialog)
-            ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
-
-            # 2. Question Text & Image
-            content_col = [
-                ft.Text(f"ID: {q.id}  •  {'Multiple Choice' if q.is_multichoice else 'Single Choice'}", color=COLORS['secondary'], size=12),
-                ft.Text(q.text, size=16, weight=ft.FontWeight.W_500),
-            ]
-            
-            # Image Handling
-            if q.image_base64:
-                img_control = ft.Image(
-                    src_base64=q.image_base64,
-                    fit=ft.ImageFit.CONTAIN,
-                    width=None, 
-                )
-                content_col.append(ft.Container(img_control, padding=10, border_radius=5))
+                text_widget = option_controls[pos][2]
+                if is_selected:
+                    text_widget.color = COLORS['success'] if is_correct else COLORS['error']
+                    text_widget.weight = ft.FontWeight.BOLD
+                else:
+                    text_widget.color = COLORS['text']
+                    text_widget.weight = ft.FontWeight.NORMAL
+                text_widget.update()
 
-            # 3. Options
-            options_col = ft.Column(spacing=10)
-            option_controls = [] 
+            else:
+                # Single choice
+                q.select_only(idx)
+                q.is_locked = True
+                engine.update_stats(q.check_answer())
+                apply_colors(q)
 
-            def on_option_click(e, idx):
-                if q.is_locked: return
+        def apply_colors(question):
+            # Disabling the column disables every row; only selected or correct rows change colour
+            options_col.disabled = True
+            correct = question.get_correct_indices()
+            changed = question.user_answers | correct
+            for idx in changed:
+                row, ctrl, txt = rows_by_option[idx]
+                is_opt_correct = idx in correct
+                is_selected = idx in question.user_answers
                 
-                if q.is_multichoice:
-                    # Immediate coloring for CLICKED item
-                    is_correct = q.options[idx]['is_correct']
-                    if len(option_controls) > idx:
-                        is_selected = option_controls[idx][1].value 
-                        
-                        # Sync logic
-                        q.user_answers = [i for i, (row, chk, txt) in enumerate(option_controls) if chk.value]
-
-                        text_widget = option_controls[idx][2]
-                        if is_selected:
-                            text_widget.color = COLORS['success'] if is_correct else COLORS['error']
-                            text_widget.weight = ft.FontWeight.BOLD
-                        else:
-                            text_widget.color = COLORS['text']
-                            text_widget.weight = ft.FontWeight.NORMAL
-                        text_widget.update()
+                if is_selected:
+                    if is_opt_correct:
+                        txt.color = COLORS['success']
+                        txt.weight = ft.FontWeight.BOLD
+                    else:
+                        txt.color = COLORS['error']
+                        txt.weight = ft.FontWeight.BOLD
+                elif question.is_locked:
+                    if is_opt_correct:
+                        txt.color = COLORS['success']
+                        txt.weight = ft.FontWeight.BOLD
+            page.update()
 
+        def on_next(e):
+            q = engine.get_current()
+            if not q.is_locked:
+                q.is_locked = True
+                if not q.user_answers:
+                    engine.update_stats(False)
                 else:
-                    # Single choice
-                    q.user_answers = [idx]
-                    q.is_locked = True
                     engine.update_stats(q.check_answer())
-                    apply_colors(q)
-            
-            for i, opt in enumerate(q.options):
-                if q.is_multichoice:
-                    is_checked = i in q.user_answers
-                    control = ft.Checkbox(value=is_checked, on_change=lambda e, x=i: on_option_click(e, x))
-                else:
-                    is_checked = i in q.user_answers
-                    control = ft.Checkbox(value=is_checked, on_change=lambda e, x=i: on_option_click(e, x), shape=ft.OutlinedBorder(corner_radius=100)) 
-
-                txt = ft.Text(opt['text'], size=16, expand=True, color=COLORS['text'])
-                
-                if q.is_locked:
-                    control.disabled = True
-
-                row = ft.Row([control, txt], alignment=ft.MainAxisAlignment.START, vertical_alignment=ft.CrossAxisAlignment.START)
+                apply_colors(q)
+            else:
+                engine.current_idx += 1
+                refresh_question()
+
+        def on_prev(e):
+            if engine.current_idx > 0:
+                engine.current_idx -= 1
+                refresh_question()
+
+        # 1. Header
+        header_text = ft.Text(weight=ft.FontWeight.BOLD)
+        header = ft.Row([
+            header_text,
+            ft.IconButton(ft.icons.ANALYTICS, on_click=show_stats_dialog)
+        ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
+
+        # 2. Question Text & Image
+        meta_text = ft.Text(color=COLORS['secondary'], size=12)
+        question_text_ctrl = ft.Text(size=16, weight=ft.FontWeight.W_500)
+        image_ctrl = ft.Image(fit=ft.ImageFit.CONTAIN, width=None)
+        image_container = ft.Container(image_ctrl, padding=10, border_radius=5, visible=False)
+
+        # 3. Options
+        options_col = ft.Column(spacing=10)
+
+        def ensure_option_rows(count):
+            while len(option_controls) < count:
+                control = ft.Checkbox(data=len(option_controls), on_change=on_option_click)
+                txt = ft.Text(size=16, expand=True, color=COLORS['text'])
+                row = ft.Row([control, txt], alignment=ft.MainAxisAlignment.START, vertical_alignment=ft.CrossAxisAlignment.START, visible=False)
                 option_controls.append((row, control, txt))
                 options_col.controls.append(row)
 
-            def apply_colors(question):
-                correct_indices = question.get_correct_indices()
-                for i, (row, ctrl, txt) in enumerate(option_controls):
-                    is_opt_correct = i in correct_indices
-                    is_selected = i in question.user_answers
-                    ctrl.disabled = True
-                    
-                    if is_selected:
-                        if is_opt_correct:
-                            txt.color = COLORS['success']
-                            txt.weight = ft.FontWeight.BOLD
-                        else:
-                            txt.color = COLORS['error']
-                            txt.weight = ft.FontWeight.BOLD
-                    elif question.is_locked:
-                        if is_opt_correct:
-                            txt.color = COLORS['success']
-                            txt.weight = ft.FontWeight.BOLD
+        ensure_option_rows(MAX_OPTIONS)
+
+        # 4. Navigation
+        btn_prev = ft.ElevatedButton("Previous", on_click=on_prev)
+        btn_next = ft.ElevatedButton("Next", on_click=on_next, bgcolor=COLORS['primary'], color="white")
+        nav_row = ft.Row([btn_prev, btn_next], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
+
+        question_view = [
+            ft.Container(padding=10, content=header),
+            ft.Divider(),
+            ft.Card(
+                elevation=2,
+                content=ft.Container(
+                    padding=15,
+                    bgcolor=COLORS['bg_card'],
+                    content=ft.Column([meta_text, question_text_ctrl, image_container, ft.Divider(), options_col])
+                )
+            ),
+            ft.Container(height=20),
+            nav_row
+        ]
+
+        def show_question_view():
+            page.clean()
+            page.add(*question_view)
+            refresh_question()
+
+        def refresh_question():
+            q = engine.get_current()
+            
+            if not q:
+                # Show summary
+                page.clean()
+                page.add(ft.Text("Exam Finished!", size=30), 
+                         ft.Text(get_stats_text(), size=20),
+                         ft.ElevatedButton("Restart", on_click=go_home))
                 page.update()
+                return
+
+            header_text.value = f"Q {engine.current_idx + 1} / {engine.total}"
+            meta_text.value = f"ID: {q.id}  •  {'Multiple Choice' if q.is_multichoice else 'Single Choice'}"
+            question_text_ctrl.value = q.text
+            
+            # Image Handling
+            if q.image_path:
+                image_ctrl.src = q.image_path
+                image_ctrl.src_base64 = None
+                image_container.visible = True
+            elif q.image_base64:
+                image_ctrl.src = None
+                image_ctrl.src_base64 = q.image_base64
+                image_container.visible = True
+            else:
+                image_ctrl.src = None
+                image_ctrl.src_base64 = None
+                image_container.visible = False
+
+            # Reset the pooled rows; rows past this question's options are hidden
+            ensure_option_rows(len(q.display_order))
+            rows_by_option.clear()
+            options_col.disabled = q.is_locked
+            for pos, (row, control, txt) in enumerate(option_controls):
+                if pos >= len(q.display_order):
+                    row.visible = False
+                    continue
+                idx = q.display_order[pos]
+                rows_by_option[idx] = (row, control, txt)
+                row.visible = True
+                control.value = idx in q.user_answers
+                control.shape = None if q.is_multichoice else round_shape
+                txt.value = q.options[idx].text
+                txt.color = COLORS['text']
+                txt.weight = ft.FontWeight.NORMAL
+
+            btn_prev.disabled = (engine.current_idx == 0)
+            btn_next.text = "Next" if not q.is_locked else "Continue >"
 
             if q.is_locked:
                 apply_colors(q)
-
-            # 4. Navigation
-            def on_next(e):
-                if not q.is_locked:
-                    q.is_locked = True
-                    if not q.user_answers:
-                        engine.update_stats(False)
-                    else:
-                        engine.update_stats(q.check_answer())
-                    apply_colors(q)
-                else:
-                    engine.current_idx += 1
-                    load_question_ui()
-
-            def on_prev(e):
-                if engine.current_idx > 0:
-                    engine.current_idx -= 1
-                    load_question_ui()
-
-            nav_row = ft.Row([
-                ft.ElevatedButton("Previous", on_click=on_prev, disabled=(engine.current_idx == 0)),
-                ft.ElevatedButton("Next" if not q.is_locked else "Continue >", on_click=on_next, bgcolor=COLORS['primary'], color="white")
-            ], alignment=ft.MainAxisAlignment.SPACE_BETWEEN)
-
-            page.add(
-                ft.Container(padding=10, content=header),
-                ft.Divider(),
-                ft.Card(
-                    elevation=2,
-                    content=ft.Container(
-                        padding=15,
-                        bgcolor=COLORS['bg_card'],
-                        content=ft.Column(content_col + [ft.Divider(), options_col])
-                    )
-                ),
-                ft.Container(height=20),
-                nav_row
-            )
-            page.update()
+            else:
+                page.update()
 
         page.add(startup_view)
         page.update() # Explicitly update the page after adding views